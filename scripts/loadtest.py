@@ -0,0 +1,739 @@
+"""Load-test the HomeControl HTTP views with a fleet of polling clients.
+
+The views are served from a local aiohttp test server backed by a stand-in
+``hass`` (config entry, lovelace dashboards, entity/device registries and
+states) so no running Home Assistant instance is needed. Only the
+``homeassistant`` and ``aiohttp`` packages must be importable. The stand-in
+is duck-typed against HA internals (``request_handler_factory``, registry
+helpers) and was checked with homeassistant 2024.3.3 and aiohttp 3.9.3;
+other versions may need the fakes adjusted.
+
+The server runs on the main event loop and the simulated clients run in a
+separate process, so they do not share the GIL with the server. The reported
+event-loop lag is therefore the server's own, although on a machine with
+few cores both processes still compete for CPU time.
+
+Example:
+
+    python scripts/loadtest.py --clients 300 --duration 60 \
+        --mix dashboard=1,entity=8,device=2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import random
+import secrets
+import sys
+import time
+import warnings
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import astuple, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector, web
+from aiohttp.test_utils import TestServer
+from aiohttp.web_exceptions import NotAppKeyWarning
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.components.http.const import KEY_AUTHENTICATED  # noqa: E402
+from homeassistant.components.lovelace import DOMAIN as LOVELACE_DOMAIN  # noqa: E402
+from homeassistant.helpers import device_registry as dr  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+
+from custom_components.homecontrol.const import CONF_DASHBOARD, DOMAIN  # noqa: E402
+from custom_components.homecontrol.http import (  # noqa: E402
+    HomeControlDashboardView,
+    HomeControlDeviceView,
+    HomeControlEntityView,
+)
+
+ENDPOINTS = ("dashboard", "entity", "device")
+DASHBOARD_ID = "homecontrol-load"
+
+
+class HarnessError(Exception):
+    """Raised when the harness itself is broken, not merely slow."""
+
+
+# --- Stand-in Home Assistant -------------------------------------------------
+
+
+@dataclass
+class FakeConfigEntry:
+    options: dict[str, Any]
+
+
+class FakeConfigEntries:
+    def __init__(self, entries: list[FakeConfigEntry]) -> None:
+        self._entries = entries
+
+    def async_entries(self, domain: str) -> list[FakeConfigEntry]:
+        return self._entries if domain == DOMAIN else []
+
+
+@dataclass
+class FakeState:
+    state: str
+    attributes: dict[str, Any]
+    last_updated: datetime
+
+
+class FakeStates:
+    def __init__(self, states: dict[str, FakeState]) -> None:
+        self._states = states
+
+    def get(self, entity_id: str) -> FakeState | None:
+        return self._states.get(entity_id)
+
+
+@dataclass
+class FakeEntityEntry:
+    entity_id: str
+    unique_id: str
+    platform: str
+    device_id: str | None
+    config_entry_id: str
+    original_name: str
+    area_id: str | None = None
+    disabled_by: str | None = None
+
+
+@dataclass
+class FakeDeviceEntry:
+    id: str
+    name: str
+    manufacturer: str
+    model: str
+    config_entries: set[str]
+    identifiers: set[tuple[str, str]]
+    connections: set[tuple[str, str]] = field(default_factory=set)
+    name_by_user: str | None = None
+    sw_version: str | None = None
+    hw_version: str | None = None
+    via_device_id: str | None = None
+    area_id: str | None = None
+    disabled_by: str | None = None
+    entry_type: str | None = None
+
+
+class FakeEntityRegistry:
+    def __init__(self, entries: dict[str, FakeEntityEntry]) -> None:
+        self.entities = entries
+        self._by_device: dict[str, list[FakeEntityEntry]] = {}
+        for entry in entries.values():
+            if entry.device_id:
+                self._by_device.setdefault(entry.device_id, []).append(entry)
+
+    def async_get(self, entity_id: str) -> FakeEntityEntry | None:
+        return self.entities.get(entity_id)
+
+    def entries_for_device(self, device_id: str) -> list[FakeEntityEntry]:
+        return self._by_device.get(device_id, [])
+
+
+class FakeDeviceRegistry:
+    def __init__(self, devices: dict[str, FakeDeviceEntry]) -> None:
+        self.devices = devices
+
+    def async_get(self, device_id: str) -> FakeDeviceEntry | None:
+        return self.devices.get(device_id)
+
+
+class FakeDashboard:
+    """Lovelace dashboard returning a cached config, like the storage backend."""
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        self._config = config
+
+    async def async_load(self, force: bool) -> dict[str, Any]:
+        return self._config
+
+
+@dataclass
+class FakeLovelaceData:
+    dashboards: dict[str | None, FakeDashboard]
+
+
+class FakeHass:
+    def __init__(self) -> None:
+        self.is_running = True
+        self.is_stopping = False
+        self.data: dict[str, Any] = {}
+        self.config_entries = FakeConfigEntries([])
+        self.states = FakeStates({})
+
+
+@dataclass
+class Fixture:
+    hass: FakeHass
+    entity_reg: FakeEntityRegistry
+    device_reg: FakeDeviceRegistry
+    entity_ids: list[str]
+    device_ids: list[str]
+
+
+def build_fixture(args: argparse.Namespace) -> Fixture:
+    """Create a stand-in hass with synthetic devices, entities and dashboards."""
+    now = datetime.now(timezone.utc)
+    entities: dict[str, FakeEntityEntry] = {}
+    devices: dict[str, FakeDeviceEntry] = {}
+    states: dict[str, FakeState] = {}
+    domains = ("light", "sensor", "switch", "binary_sensor")
+
+    for d in range(args.devices):
+        device_id = f"device{d:05d}"
+        devices[device_id] = FakeDeviceEntry(
+            id=device_id,
+            name=f"Device {d}",
+            manufacturer="Load Test",
+            model="LT-1",
+            config_entries={"loadtest"},
+            identifiers={("loadtest", device_id)},
+            connections={("mac", f"02:00:00:00:{d // 256 % 256:02x}:{d % 256:02x}")},
+        )
+        for e in range(args.entities_per_device):
+            domain = domains[e % len(domains)]
+            entity_id = f"{domain}.device{d:05d}_{e}"
+            entities[entity_id] = FakeEntityEntry(
+                entity_id=entity_id,
+                unique_id=f"{device_id}-{e}",
+                platform="loadtest",
+                device_id=device_id,
+                config_entry_id="loadtest",
+                original_name=f"Device {d} entity {e}",
+            )
+            states[entity_id] = FakeState(
+                state="on" if domain != "sensor" else str(e * 1.5),
+                attributes={
+                    "friendly_name": f"Device {d} entity {e}",
+                    "icon": "mdi:flash",
+                },
+                last_updated=now,
+            )
+
+    entity_reg = FakeEntityRegistry(entities)
+    entity_ids = list(entities)
+    device_ids = list(devices)
+
+    def dashboard_config() -> dict[str, Any]:
+        views: list[dict[str, Any]] = []
+        for v in range(args.views):
+            start = (v * args.cards_per_view) % max(len(device_ids), 1)
+            cards: list[dict[str, Any]] = []
+            for c in range(args.cards_per_view):
+                if not device_ids:
+                    break
+                device_id = device_ids[(start + c) % len(device_ids)]
+                cards.append(
+                    {"type": "heading", "heading": f"Room {c}", "heading_style": "title"}
+                )
+                cards.append(
+                    {
+                        "type": "entities",
+                        "entities": [
+                            {"entity": e.entity_id}
+                            for e in entity_reg.entries_for_device(device_id)
+                        ],
+                    }
+                )
+            views.append(
+                {
+                    "title": f"View {v}",
+                    "path": f"view-{v}",
+                    "type": "sections",
+                    "sections": [{"cards": cards}],
+                    "badges": [{"entity": eid} for eid in entity_ids[:3]],
+                }
+            )
+        return {"views": views}
+
+    # async_get_dashboards walks every dashboard, not only the selected one
+    dashboards: dict[str | None, FakeDashboard] = {
+        DASHBOARD_ID: FakeDashboard(dashboard_config())
+    }
+    for i in range(args.dashboards - 1):
+        dashboards[f"other-{i}"] = FakeDashboard(dashboard_config())
+
+    hass = FakeHass()
+    hass.data[LOVELACE_DOMAIN] = FakeLovelaceData(dashboards)
+    hass.config_entries = FakeConfigEntries(
+        [FakeConfigEntry(options={CONF_DASHBOARD: DASHBOARD_ID})]
+    )
+    hass.states = FakeStates(states)
+
+    return Fixture(
+        hass=hass,
+        entity_reg=entity_reg,
+        device_reg=FakeDeviceRegistry(devices),
+        entity_ids=entity_ids,
+        device_ids=device_ids,
+    )
+
+
+def patch_registries(stack: ExitStack, fixture: Fixture) -> None:
+    """Route the registry helpers used by the views to the stand-in registries."""
+    stack.enter_context(
+        mock.patch.object(er, "async_get", lambda hass: fixture.entity_reg)
+    )
+    stack.enter_context(
+        mock.patch.object(
+            er,
+            "async_entries_for_device",
+            lambda registry, device_id, *a, **kw: registry.entries_for_device(
+                device_id
+            ),
+        )
+    )
+    stack.enter_context(
+        mock.patch.object(dr, "async_get", lambda hass: fixture.device_reg)
+    )
+
+
+def build_app(hass: FakeHass, token: str) -> web.Application:
+    """Return an aiohttp app serving the HomeControl views behind bearer auth."""
+
+    @web.middleware
+    async def auth_middleware(request: web.Request, handler):
+        request[KEY_AUTHENTICATED] = (
+            request.headers.get("Authorization") == f"Bearer {token}"
+        )
+        return await handler(request)
+
+    app = web.Application(middlewares=[auth_middleware])
+    with warnings.catch_warnings():
+        # The views look hass up by the plain "hass" key, as HA also provides
+        warnings.simplefilter("ignore", NotAppKeyWarning)
+        app["hass"] = hass
+    for view in (
+        HomeControlDashboardView(),
+        HomeControlEntityView(),
+        HomeControlDeviceView(),
+    ):
+        view.register(hass, app, app.router)
+    return app
+
+
+# --- Load generation ---------------------------------------------------------
+
+
+@dataclass
+class Sample:
+    endpoint: str
+    # Seconds from the planned send time to the end of the response
+    latency: float
+    status: int
+    # None on success, otherwise "HTTP <status>" or the exception class name
+    error: str | None = None
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """Parse ``dashboard=1,entity=3,device=1`` into endpoint weights."""
+    mix: dict[str, float] = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"unknown endpoint: {name!r}")
+        if name in mix:
+            raise argparse.ArgumentTypeError(f"duplicate endpoint: {name!r}")
+        try:
+            value = float(weight or 1)
+        except ValueError as err:
+            raise argparse.ArgumentTypeError(f"invalid weight: {part!r}") from err
+        if not math.isfinite(value) or value < 0:
+            raise argparse.ArgumentTypeError(
+                f"weight must be finite and >= 0: {part!r}"
+            )
+        mix[name] = value
+    if sum(mix.values()) <= 0:
+        raise argparse.ArgumentTypeError("mix weights must sum to more than zero")
+    return mix
+
+
+def request_params(endpoint: str, entity_id: str, device_id: str) -> dict[str, str]:
+    """Return the query parameters for a request to ``endpoint``."""
+    if endpoint == "entity":
+        return {"entity_id": entity_id}
+    if endpoint == "device":
+        return {"device_id": device_id}
+    return {}
+
+
+async def smoke_check(base_url: str, token: str, fixture: Fixture) -> None:
+    """Send one request per endpoint and fail fast if the harness is broken."""
+    headers = {"Authorization": f"Bearer {token}"}
+    async with ClientSession(timeout=ClientTimeout(total=30)) as session:
+        for endpoint in ENDPOINTS:
+            params = request_params(
+                endpoint, fixture.entity_ids[0], fixture.device_ids[0]
+            )
+            try:
+                async with session.get(
+                    f"{base_url}/api/homecontrol/{endpoint}",
+                    params=params,
+                    headers=headers,
+                ) as resp:
+                    status = resp.status
+                    body = await resp.text()
+            except (asyncio.TimeoutError, ClientError) as err:
+                raise HarnessError(
+                    f"smoke request to {endpoint} failed: {type(err).__name__}"
+                ) from err
+            if not 200 <= status < 300:
+                raise HarnessError(
+                    f"smoke request to {endpoint} failed with "
+                    f"HTTP {status}: {body[:500]}"
+                )
+
+
+async def poller(
+    idx: int,
+    session: ClientSession,
+    base_url: str,
+    token: str,
+    entity_ids: list[str],
+    device_ids: list[str],
+    args: argparse.Namespace,
+    deadline: float,
+    samples: list[Sample],
+) -> None:
+    """Poll the views like a single tablet until the deadline.
+
+    Polls follow a fixed schedule rather than sleeping after each response,
+    and latency is measured from the planned send time. A slow server thus
+    shows up as latency and a lower achieved rate instead of fewer polls.
+    """
+    rng = random.Random(args.seed + idx)
+    names = list(args.mix)
+    weights = [args.mix[n] for n in names]
+    headers = {"Authorization": f"Bearer {token}"}
+    jitter = args.interval * args.jitter
+
+    # Spread clients across the first interval instead of firing in lockstep
+    next_at = time.monotonic() + rng.uniform(0, args.interval)
+
+    while next_at < deadline and time.monotonic() < deadline:
+        delay = next_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        planned = next_at
+        next_at += args.interval + rng.uniform(-jitter, jitter)
+
+        endpoint = rng.choices(names, weights)[0]
+        params = request_params(
+            endpoint, rng.choice(entity_ids), rng.choice(device_ids)
+        )
+        try:
+            async with session.get(
+                f"{base_url}/api/homecontrol/{endpoint}",
+                params=params,
+                headers=headers,
+            ) as resp:
+                await resp.read()
+                status = resp.status
+            error = None if 200 <= status < 300 else f"HTTP {status}"
+        except (asyncio.TimeoutError, ClientError) as err:
+            status = 0
+            error = type(err).__name__
+        samples.append(Sample(endpoint, time.monotonic() - planned, status, error))
+
+
+async def run_clients(
+    base_url: str,
+    token: str,
+    entity_ids: list[str],
+    device_ids: list[str],
+    args: argparse.Namespace,
+) -> tuple[list[Sample], float]:
+    """Run all pollers on the current loop; return the samples and elapsed time."""
+    samples: list[Sample] = []
+    connector = TCPConnector(limit=0)
+    timeout = ClientTimeout(total=args.timeout)
+    async with ClientSession(connector=connector, timeout=timeout) as session:
+        start = time.monotonic()
+        deadline = start + args.duration
+        await asyncio.gather(
+            *(
+                poller(
+                    i,
+                    session,
+                    base_url,
+                    token,
+                    entity_ids,
+                    device_ids,
+                    args,
+                    deadline,
+                    samples,
+                )
+                for i in range(args.clients)
+            )
+        )
+        elapsed = time.monotonic() - start
+    return samples, elapsed
+
+
+def client_process(
+    base_url: str,
+    token: str,
+    entity_ids: list[str],
+    device_ids: list[str],
+    args: argparse.Namespace,
+) -> tuple[list[tuple], float]:
+    """Run the pollers in a worker process.
+
+    Samples are returned as plain tuples because the spawned child imports
+    this script under a different module name than the parent.
+    """
+    samples, elapsed = asyncio.run(
+        run_clients(base_url, token, entity_ids, device_ids, args)
+    )
+    return [astuple(sample) for sample in samples], elapsed
+
+
+async def monitor_loop_lag(interval: float, lags: list[float]) -> None:
+    """Record how late the event loop wakes up from a fixed sleep."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, loop.time() - start - interval))
+
+
+# --- Reporting ---------------------------------------------------------------
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of ``values`` (0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(
+    samples: list[Sample],
+    lags: list[float],
+    elapsed: float,
+    args: argparse.Namespace,
+) -> dict:
+    def latency_stats(group: list[Sample]) -> dict[str, Any]:
+        latencies = [s.latency * 1000 for s in group]
+        return {
+            "requests": len(group),
+            "errors": sum(1 for s in group if s.error is not None),
+            "throughput_rps": len(group) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": max(latencies, default=0.0),
+        }
+
+    lag_ms = [lag * 1000 for lag in lags]
+    return {
+        "elapsed_s": elapsed,
+        "offered_rps": args.clients / args.interval,
+        "achieved_rps": len(samples) / elapsed if elapsed else 0.0,
+        "total": latency_stats(samples),
+        "errors_by_kind": dict(
+            Counter(s.error for s in samples if s.error is not None).most_common()
+        ),
+        "endpoints": {
+            name: latency_stats([s for s in samples if s.endpoint == name])
+            for name in ENDPOINTS
+            if any(s.endpoint == name for s in samples)
+        },
+        "loop_lag": {
+            "samples": len(lag_ms),
+            "p50_ms": percentile(lag_ms, 50),
+            "p95_ms": percentile(lag_ms, 95),
+            "p99_ms": percentile(lag_ms, 99),
+            "max_ms": max(lag_ms, default=0.0),
+        },
+    }
+
+
+def print_report(report: dict, args: argparse.Namespace) -> None:
+    print(
+        f"{args.clients} clients, {args.duration:g}s, interval {args.interval:g}s, "
+        f"{args.devices} devices x {args.entities_per_device} entities, "
+        f"{args.dashboards} dashboard(s)"
+    )
+    print("latency is measured from each poll's planned send time")
+    header = (
+        f"{'endpoint':<10} {'reqs':>8} {'errors':>7} {'req/s':>9} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    rows = [*report["endpoints"].items(), ("total", report["total"])]
+    for name, st in rows:
+        print(
+            f"{name:<10} {st['requests']:>8} {st['errors']:>7} "
+            f"{st['throughput_rps']:>9.1f} {st['p50_ms']:>9.2f} "
+            f"{st['p95_ms']:>9.2f} {st['p99_ms']:>9.2f} {st['max_ms']:>9.2f}"
+        )
+    print(
+        f"\noffered {report['offered_rps']:.1f} req/s, "
+        f"achieved {report['achieved_rps']:.1f} req/s"
+    )
+    for kind, count in report["errors_by_kind"].items():
+        print(f"errors: {count} x {kind}")
+    lag = report["loop_lag"]
+    print(
+        f"event-loop lag: p50 {lag['p50_ms']:.2f} ms, p95 {lag['p95_ms']:.2f} ms, "
+        f"p99 {lag['p99_ms']:.2f} ms, max {lag['max_ms']:.2f} ms "
+        f"({lag['samples']} samples)"
+    )
+
+
+# --- Entry point -------------------------------------------------------------
+
+
+async def async_main(args: argparse.Namespace) -> dict:
+    fixture = build_fixture(args)
+    token = secrets.token_hex(16)
+
+    with ExitStack() as stack:
+        patch_registries(stack, fixture)
+        server = TestServer(build_app(fixture.hass, token), host="127.0.0.1")
+        await server.start_server()
+        lags: list[float] = []
+        lag_task: asyncio.Task | None = None
+        try:
+            base_url = str(server.make_url("")).rstrip("/")
+            await smoke_check(base_url, token, fixture)
+
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                # Start the worker (which re-imports this script) before
+                # sampling lag, so idle startup time is not measured
+                await loop.run_in_executor(pool, os.getpid)
+                lag_task = asyncio.create_task(
+                    monitor_loop_lag(args.lag_interval, lags)
+                )
+                rows, elapsed = await loop.run_in_executor(
+                    pool,
+                    client_process,
+                    base_url,
+                    token,
+                    fixture.entity_ids,
+                    fixture.device_ids,
+                    args,
+                )
+            samples = [Sample(*row) for row in rows]
+        finally:
+            if lag_task is not None:
+                lag_task.cancel()
+            await server.close()
+
+    return summarize(samples, lags, elapsed, args)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=200, help="concurrent pollers")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to run")
+    parser.add_argument(
+        "--interval", type=float, default=1.0, help="seconds between polls per client"
+    )
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=0.1,
+        help="random +/- fraction applied to the poll interval",
+    )
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=parse_mix("dashboard=1,entity=3,device=1"),
+        help="endpoint weights, e.g. dashboard=1,entity=3,device=1",
+    )
+    parser.add_argument("--devices", type=int, default=200)
+    parser.add_argument("--entities-per-device", type=int, default=4)
+    parser.add_argument("--dashboards", type=int, default=1)
+    parser.add_argument("--views", type=int, default=5)
+    parser.add_argument("--cards-per-view", type=int, default=20)
+    parser.add_argument(
+        "--timeout", type=float, default=30.0, help="per-request timeout in seconds"
+    )
+    parser.add_argument(
+        "--lag-interval",
+        type=float,
+        default=0.05,
+        help="event-loop lag sampling interval in seconds",
+    )
+    parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=0.01,
+        help="exit non-zero when the fraction of failed requests exceeds this",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.clients < 1 or args.devices < 1 or args.entities_per_device < 1:
+        parser.error("--clients, --devices and --entities-per-device must be >= 1")
+    if args.dashboards < 1 or args.views < 1 or args.cards_per_view < 1:
+        # An empty dashboard makes every dashboard request a 404
+        parser.error("--dashboards, --views and --cards-per-view must be >= 1")
+    for name in ("duration", "interval", "timeout", "lag_interval"):
+        if getattr(args, name) <= 0:
+            parser.error(f"--{name.replace('_', '-')} must be > 0")
+    if args.duration < args.interval:
+        # Clients start at a random point in the first interval, so shorter
+        # runs leave many of them idle and understate the offered rate
+        parser.error("--duration must be >= --interval")
+    if not 0 <= args.jitter < 1:
+        parser.error("--jitter must be >= 0 and < 1")
+    if not 0 <= args.max_error_rate <= 1:
+        parser.error("--max-error-rate must be between 0 and 1")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    try:
+        report = asyncio.run(async_main(args))
+    except HarnessError as err:
+        print(f"error: {err}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args)
+
+    total = report["total"]
+    if not total["requests"]:
+        print("error: the run produced no requests", file=sys.stderr)
+        return 2
+    error_rate = total["errors"] / total["requests"]
+    if error_rate > args.max_error_rate:
+        print(
+            f"warning: {error_rate:.1%} of {total['requests']} requests failed "
+            f"(limit {args.max_error_rate:.1%}); the numbers above are not a "
+            "valid benchmark",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())